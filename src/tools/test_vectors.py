@@ -9,28 +9,235 @@ Usage:
     uv run python src/tools/test_vectors.py --output tests/vectors/
 """
 
-import argparse
+import array
+import hashlib
+import os
 import struct
+from functools import cached_property, lru_cache
 from pathlib import Path
 from dataclasses import dataclass
 
+# NumPy is only needed by the batch, Numba and TileTestVectorSet paths;
+# it is imported there so plain crc16_ccitt() users don't pay for it.
+# TYPE_CHECKING is spelled out to avoid importing typing at runtime.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _crc16_ccitt_table_entry(index: int, bits: int = 8) -> int:
+    """Bit-serial CRC of a `bits`-wide input shifted into the top of the register"""
+    crc = index << (16 - bits)
+    for _ in range(bits):
+        if crc & 0x8000:
+            crc = ((crc << 1) ^ 0x1021) & 0xFFFF
+        else:
+            crc = (crc << 1) & 0xFFFF
+    return crc
+
+
+# Byte-wise lookup table (Sarwate) for polynomial 0x1021, stored as raw
+# uint16 (512 bytes) rather than a tuple of boxed ints
+_CRC16_CCITT_TABLE = array.array('H', [_crc16_ccitt_table_entry(i) for i in range(256)])
+
+def _crc16_ccitt_table_np() -> "np.ndarray":
+    """uint16 NumPy view sharing _CRC16_CCITT_TABLE's buffer"""
+    import numpy as np
+    return np.frombuffer(_CRC16_CCITT_TABLE, dtype=np.uint16)
+
+
+# Below this length the bytes -> ndarray conversion costs more than the JIT saves
+_NUMBA_MIN_LEN = 16
+
+
+def _crc16_ccitt_kernel(data, init, table):
+    """
+    Byte-table CRC loop compiled by Numba in _load_crc16_ccitt_nb().
+    The table is an argument rather than a global, so Numba doesn't
+    freeze a copy of it into the compiled (and disk-cached) kernel.
+    """
+    crc = init & 0xFFFF  # widen to int64 so the register keeps one type
+    for byte in data:
+        crc = ((crc << 8) ^ table[((crc >> 8) ^ byte) & 0xFF]) & 0xFFFF
+    return crc
+
+
+# Numba-compiled _crc16_ccitt_kernel; imported and compiled on first use
+_crc16_ccitt_nb = None
+_crc16_ccitt_nb_loaded = False
+
+
+def _load_crc16_ccitt_nb():
+    """Compile the Numba CRC kernel, or return None if Numba is unavailable"""
+    global _crc16_ccitt_nb, _crc16_ccitt_nb_loaded
+    if not _crc16_ccitt_nb_loaded:
+        _crc16_ccitt_nb_loaded = True
+        try:
+            from numba import njit, types, uint16
+        except ImportError:  # Numba is optional; fall back to the pure-Python loop
+            return None
+        # np.frombuffer() over bytes yields a read-only array
+        signature = uint16(types.Array(types.uint8, 1, 'C', readonly=True), uint16,
+                           types.Array(types.uint16, 1, 'C'))
+        _crc16_ccitt_nb = njit(signature, cache=True, boundscheck=False)(
+            _crc16_ccitt_kernel)
+    return _crc16_ccitt_nb
+
+
+def _as_bytes(data) -> bytes:
+    """Normalize bytes-like or iterable-of-ints input to bytes"""
+    if isinstance(data, int):
+        # bytes(n) would silently hash n zero bytes
+        raise TypeError(f"expected bytes-like data, not {type(data).__name__}")
+    return bytes(data)
+
 
 def crc16_ccitt(data: bytes, init: int = 0xFFFF) -> int:
     """
     CRC-16-CCITT (polynomial 0x1021).
     Must match tile_hash_generator.sv exactly.
+    Table-driven: one lookup per byte instead of eight shift/XOR steps.
+    Inputs of _NUMBA_MIN_LEN bytes or more use a Numba-compiled kernel
+    when Numba is installed; it is imported and compiled on first use.
+
+    Accepts any bytes-like or iterable of ints; results are memoized.
+    Call crc16_ccitt.cache_clear() after patching _CRC16_CCITT_TABLE.
     """
+    return _crc16_ccitt_cached(_as_bytes(data), init)
+
+
+@lru_cache(maxsize=1024)
+def _crc16_ccitt_cached(data: bytes, init: int) -> int:
+    """Memoized body of crc16_ccitt(); `data` must be bytes"""
+    if len(data) >= _NUMBA_MIN_LEN:
+        kernel = _load_crc16_ccitt_nb()
+        if kernel is not None:
+            import numpy as np
+            return int(kernel(np.frombuffer(data, dtype=np.uint8), init,
+                              _crc16_ccitt_table_np()))
+
+    table = _CRC16_CCITT_TABLE
     crc = init
     for byte in data:
-        crc ^= byte << 8
-        for _ in range(8):
-            if crc & 0x8000:
-                crc = ((crc << 1) ^ 0x1021) & 0xFFFF
-            else:
-                crc = (crc << 1) & 0xFFFF
+        crc = ((crc << 8) ^ table[((crc >> 8) ^ byte) & 0xFF]) & 0xFFFF
     return crc
 
 
+crc16_ccitt.cache_clear = _crc16_ccitt_cached.cache_clear
+
+
+# Nibble-wise lookup table for polynomial 0x1021
+_CRC16_CCITT_NIBBLE_TABLE = array.array(
+    'H', [_crc16_ccitt_table_entry(i, bits=4) for i in range(16)]
+)
+
+
+def crc16_ccitt_nibble(data: bytes, init: int = 0xFFFF) -> int:
+    """
+    CRC-16-CCITT (polynomial 0x1021), processed 4 bits at a time.
+    Mirrors a half-byte-per-cycle RTL pipeline; results are identical
+    to crc16_ccitt().
+    """
+    table = _CRC16_CCITT_NIBBLE_TABLE
+    crc = init
+    for byte in data:
+        crc = (table[((crc >> 12) ^ (byte >> 4)) & 0xF] ^ (crc << 4)) & 0xFFFF
+        crc = (table[((crc >> 12) ^ (byte & 0xF)) & 0xF] ^ (crc << 4)) & 0xFFFF
+    return crc
+
+
+def _crc16_ccitt_advance_table(table: array.array) -> array.array:
+    """Advance every entry of a lookup table by one zero byte"""
+    base = _CRC16_CCITT_TABLE
+    return array.array(
+        'H', [((crc << 8) ^ base[crc >> 8]) & 0xFFFF for crc in table]
+    )
+
+
+def _crc16_ccitt_slice_tables(count: int) -> list[array.array]:
+    """Tables T0..T{count-1}, where Tk[b] is the CRC of byte b then k zero bytes"""
+    tables = [_CRC16_CCITT_TABLE]
+    while len(tables) < count:
+        tables.append(_crc16_ccitt_advance_table(tables[-1]))
+    return tables
+
+
+# Slice-by-4 tables: _CRC16_CCITT_SLICE4[k][b] is the CRC contribution of
+# byte b followed by k zero bytes
+_CRC16_CCITT_SLICE4 = _crc16_ccitt_slice_tables(4)
+
+
+def crc16_ccitt_slice4(data: bytes, init: int = 0xFFFF) -> int:
+    """
+    CRC-16-CCITT (polynomial 0x1021), consuming one 32-bit word per step.
+    The four table lookups per word are independent, which suits bulk
+    data (BG maps, OAM) larger than a single tile. Accepts the same inputs
+    as crc16_ccitt() and returns identical results.
+    """
+    data = _as_bytes(data)
+
+    t0, t1, t2, t3 = _CRC16_CCITT_SLICE4
+    crc = init
+    end = len(data) & ~3
+    for (word,) in struct.iter_unpack('>I', data[:end]):
+        w = word ^ (crc << 16)
+        crc = t3[w >> 24] ^ t2[(w >> 16) & 0xFF] ^ t1[(w >> 8) & 0xFF] ^ t0[w & 0xFF]
+    for byte in data[end:]:
+        crc = ((crc << 8) ^ t0[((crc >> 8) ^ byte) & 0xFF]) & 0xFFFF
+    return crc
+
+
+def crc16_ccitt_batch(tiles: "np.ndarray", init: int = 0xFFFF) -> "np.ndarray":
+    """
+    CRC-16-CCITT (polynomial 0x1021) of every row of an (N, L) uint8 array.
+    Walks the L byte columns once, doing the table lookup for all N rows
+    in a single vectorized step. Returns an (N,) uint16 array.
+    """
+    import numpy as np
+
+    table = _crc16_ccitt_table_np()
+    crc = np.full(tiles.shape[0], init, dtype=np.uint16)
+    for col in range(tiles.shape[1]):
+        idx = ((crc >> 8) ^ tiles[:, col]).astype(np.uint8)
+        crc = (crc << 8) ^ table[idx]  # uint16 arithmetic wraps to 16 bits
+    return crc
+
+
+# Native library built by `make crc-ext`; loaded on first use
+_CRC16_CCITT_LIB_PATH = Path(__file__).with_name("_crc16ccitt.so")
+_crc16_ccitt_lib = None
+_crc16_ccitt_lib_loaded = False
+
+
+def _load_crc16_ccitt_lib():
+    """Load the native CRC library via ctypes, or return None if unavailable"""
+    global _crc16_ccitt_lib, _crc16_ccitt_lib_loaded
+    if not _crc16_ccitt_lib_loaded:
+        _crc16_ccitt_lib_loaded = True
+        try:
+            import ctypes
+            lib = ctypes.CDLL(str(_CRC16_CCITT_LIB_PATH))
+        except OSError:
+            return None
+        lib.crc16_ccitt.argtypes = [ctypes.c_char_p, ctypes.c_size_t, ctypes.c_uint16]
+        lib.crc16_ccitt.restype = ctypes.c_uint16
+        _crc16_ccitt_lib = lib
+    return _crc16_ccitt_lib
+
+
+def crc16_ccitt_fast(data: bytes, init: int = 0xFFFF) -> int:
+    """
+    CRC-16-CCITT (polynomial 0x1021) via the native library when built.
+    Uses PCLMULQDQ folding on supporting x86 CPUs; falls back to
+    crc16_ccitt() if the library is missing.
+    """
+    lib = _load_crc16_ccitt_lib()
+    if lib is None:
+        return crc16_ccitt(data, init)
+    buf = _as_bytes(data)  # len(data) counts items, not bytes, for wide buffers
+    return lib.crc16_ccitt(buf, len(buf), init)
+
+
 @dataclass
 class TileTestVector:
     """Test vector for tile hash verification"""
@@ -38,50 +245,63 @@ class TileTestVector:
     tile_data: bytes  # 16 bytes
     expected_hash: int
 
+    @cached_property
     def to_hex_string(self) -> str:
-        """Tile data as hex string for Verilog $readmemh"""
-        return ''.join(f'{b:02X}' for b in self.tile_data)
+        """Tile data as hex string for Verilog $readmemh (computed once)"""
+        return self.tile_data.hex().upper()
 
 
-def generate_tile_test_vectors() -> list[TileTestVector]:
-    """Generate various test vectors for tile hashing"""
-    vectors = []
-
+@dataclass(eq=False)  # generated __eq__ can't compare the hashes ndarray
+class TileTestVectorSet:
+    """
+    Tile test vectors stored column-wise: one name list, one contiguous
+    tile data blob (16 bytes per tile) and one uint16 hash array.
+    Avoids a Python object per tile when generating large sets.
+    """
+    names: list[str]
+    flat: bytes  # 16 * len(names) bytes
+    hashes: "np.ndarray"  # uint16, one per tile
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def tile(self, i: int) -> memoryview:
+        """Zero-copy view of tile i's 16 bytes; indexes like a list"""
+        n = len(self)
+        if not -n <= i < n:
+            raise IndexError(f"tile index {i} out of range for {n} tiles")
+        i %= n
+        return memoryview(self.flat)[16 * i:16 * (i + 1)]
+
+    def to_vectors(self) -> list[TileTestVector]:
+        """Expand into one TileTestVector per tile"""
+        return [
+            TileTestVector(name=name, tile_data=self.flat[16 * i:16 * (i + 1)],
+                           expected_hash=h)
+            for i, (name, h) in enumerate(zip(self.names, self.hashes.tolist()))
+        ]
+
+
+# Deterministic pseudo-random tile, computed once at import
+_PSEUDO_RANDOM_TILE = hashlib.md5(b"test_vector_7").digest()[:16]
+
+# Tile hash test cases: (name, 16 bytes of 2bpp tile data)
+_TILES: list[tuple[str, bytes]] = [
     # Test 1: All zeros
-    data = bytes(16)
-    vectors.append(TileTestVector(
-        name="all_zeros",
-        tile_data=data,
-        expected_hash=crc16_ccitt(data)
-    ))
+    ("all_zeros", bytes(16)),
 
     # Test 2: All ones (0xFF)
-    data = bytes([0xFF] * 16)
-    vectors.append(TileTestVector(
-        name="all_ones",
-        tile_data=data,
-        expected_hash=crc16_ccitt(data)
-    ))
+    ("all_ones", bytes([0xFF] * 16)),
 
     # Test 3: Sequential bytes 0-15
-    data = bytes(range(16))
-    vectors.append(TileTestVector(
-        name="sequential",
-        tile_data=data,
-        expected_hash=crc16_ccitt(data)
-    ))
+    ("sequential", bytes(range(16))),
 
     # Test 4: Alternating pattern (checkerboard)
-    data = bytes([0xAA, 0x55] * 8)
-    vectors.append(TileTestVector(
-        name="alternating",
-        tile_data=data,
-        expected_hash=crc16_ccitt(data)
-    ))
+    ("alternating", bytes([0xAA, 0x55] * 8)),
 
     # Test 5: Simulated Japanese character tile (filled square)
     # 2bpp format: each row is 2 bytes (low bits, high bits)
-    data = bytes([
+    ("filled_square", bytes([
         0xFF, 0xFF,  # Row 0: all pixels color 3
         0xFF, 0xFF,  # Row 1
         0xFF, 0xFF,  # Row 2
@@ -90,15 +310,10 @@ def generate_tile_test_vectors() -> list[TileTestVector]:
         0xFF, 0xFF,  # Row 5
         0xFF, 0xFF,  # Row 6
         0xFF, 0xFF,  # Row 7
-    ])
-    vectors.append(TileTestVector(
-        name="filled_square",
-        tile_data=data,
-        expected_hash=crc16_ccitt(data)
-    ))
+    ])),
 
     # Test 6: Letter 'A' pattern (similar to font)
-    data = bytes([
+    ("letter_a", bytes([
         0x18, 0x00,  # Row 0:    ##
         0x3C, 0x00,  # Row 1:   ####
         0x66, 0x00,  # Row 2:  ##  ##
@@ -107,32 +322,31 @@ def generate_tile_test_vectors() -> list[TileTestVector]:
         0x66, 0x00,  # Row 5:  ##  ##
         0x66, 0x00,  # Row 6:  ##  ##
         0x00, 0x00,  # Row 7: (empty)
-    ])
-    vectors.append(TileTestVector(
-        name="letter_a",
-        tile_data=data,
-        expected_hash=crc16_ccitt(data)
-    ))
+    ])),
 
     # Test 7: Random-ish data (deterministic)
-    import hashlib
-    seed = hashlib.md5(b"test_vector_7").digest()[:16]
-    data = bytes(seed)
-    vectors.append(TileTestVector(
-        name="pseudo_random",
-        tile_data=data,
-        expected_hash=crc16_ccitt(data)
-    ))
+    ("pseudo_random", _PSEUDO_RANDOM_TILE),
 
     # Test 8: Single bit set
-    data = bytes([0x80] + [0x00] * 15)
-    vectors.append(TileTestVector(
-        name="single_bit",
-        tile_data=data,
-        expected_hash=crc16_ccitt(data)
-    ))
+    ("single_bit", bytes([0x80] + [0x00] * 15)),
+]
 
-    return vectors
+
+def generate_tile_test_vector_set() -> TileTestVectorSet:
+    """Generate various test vectors for tile hashing, stored column-wise"""
+    names = [name for name, _ in _TILES]
+    import numpy as np
+
+    flat = b''.join(data for _, data in _TILES)
+    hashes = crc16_ccitt_batch(
+        np.frombuffer(flat, dtype=np.uint8).reshape(len(names), 16)
+    )
+    return TileTestVectorSet(names=names, flat=flat, hashes=hashes)
+
+
+def generate_tile_test_vectors() -> list[TileTestVector]:
+    """Generate various test vectors for tile hashing"""
+    return generate_tile_test_vector_set().to_vectors()
 
 
 def generate_vram_write_vectors() -> list[dict]:
@@ -154,96 +368,164 @@ def generate_vram_write_vectors() -> list[dict]:
     return vectors
 
 
-def write_tile_vectors_hex(vectors: list[TileTestVector], output_dir: Path):
-    """Write tile data as hex files for Verilog $readmemh"""
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    # Tile data file (one tile per line, 32 hex chars = 16 bytes)
-    with open(output_dir / "tile_data.hex", 'w') as f:
-        f.write("// Tile test vectors - 16 bytes per line\n")
-        for v in vectors:
-            f.write(f"{v.to_hex_string()}  // {v.name}\n")
+# Verilog include file, filled in once per run by write_vector_files().
+# Tile data uses individual regs and test names a case function, since
+# Icarus Verilog doesn't handle parameter or string arrays well.
+_VERILOG_INCLUDE_TEMPLATE = """\
+// Auto-generated test vectors - DO NOT EDIT
+// Generated by test_vectors.py
+// Compatible with Icarus Verilog
+
+localparam NUM_TEST_VECTORS = {n};
+
+// Tile data: 128 bits (16 bytes) per vector
+reg [127:0] TILE_DATA [0:NUM_TEST_VECTORS-1];
+reg [15:0] EXPECTED_HASH [0:NUM_TEST_VECTORS-1];
+
+// Initialize test vectors
+task init_test_vectors;
+begin
+{inits}
+{hashes}\
+end
+endtask
+
+// Get test name by index
+function [127:0] get_test_name;
+    input integer idx;
+    begin
+        case (idx)
+{names}\
+            default: get_test_name = "unknown         ";
+        endcase
+    end
+endfunction
+"""
 
-    # Expected hashes file
-    with open(output_dir / "expected_hashes.hex", 'w') as f:
-        f.write("// Expected CRC-16 hashes\n")
-        for v in vectors:
-            f.write(f"{v.expected_hash:04X}  // {v.name}\n")
+# One get_test_name case arm; name is padded/truncated to 16 chars for
+# consistent width
+_VERILOG_CASE_ARM_TEMPLATE = '            {i}: get_test_name = "{name:<16.16}";\n'
 
-    # Combined file for easy verification
-    with open(output_dir / "tile_test_vectors.txt", 'w') as f:
-        f.write("# Tile Hash Test Vectors\n")
-        f.write("# Format: name, hex_data, expected_hash\n\n")
-        for v in vectors:
-            f.write(f"{v.name}:\n")
-            f.write(f"  data: {v.to_hex_string()}\n")
-            f.write(f"  hash: 0x{v.expected_hash:04X} ({v.expected_hash})\n\n")
 
+def _write_bytes(path: Path, data: bytes):
+    """
+    Write `data` to `path` with raw os.write, bypassing Python's buffered/text layers.
+    If the file already holds exactly `data`, only its mtime is bumped, so
+    make still sees it as newer than test_vectors.py.
+    """
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            os.utime(path)
+            return
+    except FileNotFoundError:
+        pass
+
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def write_vector_files(vectors: TileTestVectorSet, output_dir: Path):
+    """
+    Write all test vector outputs in a single pass over `vectors`:
+    tile_data.hex and expected_hashes.hex for Verilog $readmemh,
+    tile_data_annotated.txt and tile_test_vectors.txt for easy
+    verification, and test_vectors.svh (Icarus Verilog compatible include).
+    The .hex files are fixed-width records with no comments, so they can
+    be indexed by row; unchanged files are not rewritten.
+    Each file body is assembled in memory and written as ASCII bytes
+    with a single raw write.
+    """
+    from concurrent.futures import ThreadPoolExecutor
 
-def write_verilog_include(vectors: list[TileTestVector], output_dir: Path):
-    """Write Verilog include file with test vectors - Icarus Verilog compatible"""
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    with open(output_dir / "test_vectors.svh", 'w') as f:
-        f.write("// Auto-generated test vectors - DO NOT EDIT\n")
-        f.write("// Generated by test_vectors.py\n")
-        f.write("// Compatible with Icarus Verilog\n\n")
-
-        f.write(f"localparam NUM_TEST_VECTORS = {len(vectors)};\n\n")
-
-        # Tile data as individual parameters (iverilog compatible)
-        f.write("// Tile data: 128 bits (16 bytes) per vector\n")
-        f.write("reg [127:0] TILE_DATA [0:NUM_TEST_VECTORS-1];\n")
-        f.write("reg [15:0] EXPECTED_HASH [0:NUM_TEST_VECTORS-1];\n\n")
-
-        # Initial block to set values
-        f.write("// Initialize test vectors\n")
-        f.write("task init_test_vectors;\n")
-        f.write("begin\n")
-        for i, v in enumerate(vectors):
-            hex_str = v.to_hex_string()
-            f.write(f"    TILE_DATA[{i}] = 128'h{hex_str};  // {v.name}\n")
-        f.write("\n")
-        for i, v in enumerate(vectors):
-            f.write(f"    EXPECTED_HASH[{i}] = 16'h{v.expected_hash:04X};  // {v.name}\n")
-        f.write("end\n")
-        f.write("endtask\n\n")
-
-        # Test names as function (strings in arrays are tricky in iverilog)
-        f.write("// Get test name by index\n")
-        f.write("function [127:0] get_test_name;\n")
-        f.write("    input integer idx;\n")
-        f.write("    begin\n")
-        f.write("        case (idx)\n")
-        for i, v in enumerate(vectors):
-            # Pad name to 16 chars for consistent width
-            padded = v.name.ljust(16)[:16]
-            f.write(f'            {i}: get_test_name = "{padded}";\n')
-        f.write('            default: get_test_name = "unknown         ";\n')
-        f.write("        endcase\n")
-        f.write("    end\n")
-        f.write("endfunction\n")
+    # Tile data file (one tile per line, 32 hex chars = 16 bytes)
+    tile_parts = []
+
+    # Tile data with names, for humans
+    tile_annotated_parts = ["// Tile test vectors - 16 bytes per line\n"]
+
+    # Expected hashes file (one hash per line, 4 hex chars)
+    hash_parts = []
+
+    # Combined file for easy verification
+    txt_parts = [
+        "# Tile Hash Test Vectors\n",
+        "# Format: name, hex_data, expected_hash\n\n",
+    ]
+
+    # Verilog include: per-vector lines are collected separately and
+    # spliced into _VERILOG_INCLUDE_TEMPLATE below
+    svh_init_lines = []
+    svh_hash_lines = []
+    svh_name_lines = []
+
+    # Hex-encode all tiles in one call, then slice 32 chars per tile
+    all_hex = vectors.flat.hex().upper()
+    for i, (name, h) in enumerate(zip(vectors.names, vectors.hashes.tolist())):
+        hex_str = all_hex[32 * i:32 * (i + 1)]
+        tile_parts.append(f"{hex_str}\n")
+        tile_annotated_parts.append(f"{hex_str}  // {name}\n")
+        hash_parts.append(f"{h:04X}\n")
+        txt_parts.append(f"{name}:\n")
+        txt_parts.append(f"  data: {hex_str}\n")
+        txt_parts.append(f"  hash: 0x{h:04X} ({h})\n\n")
+        svh_init_lines.append(f"    TILE_DATA[{i}] = 128'h{hex_str};  // {name}\n")
+        svh_hash_lines.append(f"    EXPECTED_HASH[{i}] = 16'h{h:04X};  // {name}\n")
+        svh_name_lines.append(_VERILOG_CASE_ARM_TEMPLATE.format(i=i, name=name))
+
+    svh_text = _VERILOG_INCLUDE_TEMPLATE.format(
+        n=len(vectors),
+        inits=''.join(svh_init_lines),
+        hashes=''.join(svh_hash_lines),
+        names=''.join(svh_name_lines),
+    )
+
+    outputs = {
+        "tile_data.hex": ''.join(tile_parts),
+        "tile_data_annotated.txt": ''.join(tile_annotated_parts),
+        "expected_hashes.hex": ''.join(hash_parts),
+        "tile_test_vectors.txt": ''.join(txt_parts),
+        "test_vectors.svh": svh_text,
+    }
+
+    # Files are independent and os.write releases the GIL, so write them
+    # concurrently; result() re-raises any I/O error from a worker
+    with ThreadPoolExecutor(max_workers=len(outputs)) as pool:
+        futures = [
+            pool.submit(_write_bytes, output_dir / filename, text.encode('ascii'))
+            for filename, text in outputs.items()
+        ]
+        for future in futures:
+            future.result()
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Generate RTL test vectors")
     parser.add_argument("--output", "-o", type=Path, default=Path("tests/vectors"),
                         help="Output directory")
     args = parser.parse_args()
 
     print("Generating tile hash test vectors...")
-    tile_vectors = generate_tile_test_vectors()
+    tile_vectors = generate_tile_test_vector_set()
 
     print(f"Generated {len(tile_vectors)} test vectors:")
-    for v in tile_vectors:
-        print(f"  {v.name}: hash=0x{v.expected_hash:04X}")
+    for name, h in zip(tile_vectors.names, tile_vectors.hashes.tolist()):
+        print(f"  {name}: hash=0x{h:04X}")
 
     print(f"\nWriting to {args.output}/")
-    write_tile_vectors_hex(tile_vectors, args.output)
-    write_verilog_include(tile_vectors, args.output)
+    write_vector_files(tile_vectors, args.output)
 
     print("\nFiles generated:")
     print(f"  {args.output}/tile_data.hex")
+    print(f"  {args.output}/tile_data_annotated.txt")
     print(f"  {args.output}/expected_hashes.hex")
     print(f"  {args.output}/tile_test_vectors.txt")
     print(f"  {args.output}/test_vectors.svh")
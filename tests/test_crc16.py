@@ -0,0 +1,143 @@
+"""
+test_crc16.py
+
+Checks every CRC-16-CCITT implementation in src/tools/test_vectors.py
+against a bit-serial reference, so they stay in lockstep with
+tile_hash_generator.sv.
+
+Usage:
+    make test-python
+"""
+
+import array
+import random
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import test_vectors as tv
+
+VECTOR_DIR = Path(__file__).parent / "vectors"
+
+LENGTHS = range(0, 71)
+INITS = [0xFFFF, 0x0000] + random.Random(0x1021).sample(range(0x10000), 6)
+
+
+def crc16_reference(data: bytes, init: int = 0xFFFF) -> int:
+    """Bit-serial CRC-16-CCITT (polynomial 0x1021), the pre-table algorithm"""
+    crc = init
+    for byte in data:
+        crc ^= byte << 8
+        for _ in range(8):
+            if crc & 0x8000:
+                crc = ((crc << 1) ^ 0x1021) & 0xFFFF
+            else:
+                crc = (crc << 1) & 0xFFFF
+    return crc
+
+
+def payload(length: int) -> bytes:
+    """Deterministic pseudo-random payload of the given length"""
+    return random.Random(length).randbytes(length)
+
+
+SCALAR_IMPLS = [
+    tv.crc16_ccitt,
+    tv.crc16_ccitt_nibble,
+    tv.crc16_ccitt_slice4,
+    tv.crc16_ccitt_fast,
+]
+
+
+@pytest.mark.parametrize("impl", SCALAR_IMPLS, ids=lambda f: f.__name__)
+@pytest.mark.parametrize("name,data", tv._TILES, ids=[name for name, _ in tv._TILES])
+def test_tiles_match_reference(impl, name, data):
+    assert impl(data) == crc16_reference(data)
+
+
+@pytest.mark.parametrize("impl", SCALAR_IMPLS, ids=lambda f: f.__name__)
+@pytest.mark.parametrize("init", INITS, ids=lambda i: f"init{i:04X}")
+def test_lengths_and_inits_match_reference(impl, init):
+    for length in LENGTHS:
+        data = payload(length)
+        assert impl(data, init) == crc16_reference(data, init), length
+
+
+@pytest.mark.parametrize("length", [256, 1000, 4097])
+def test_fast_matches_reference_on_bulk_data(length):
+    data = payload(length)
+    assert tv.crc16_ccitt_fast(data) == crc16_reference(data)
+
+
+@pytest.mark.parametrize("init", INITS, ids=lambda i: f"init{i:04X}")
+def test_batch_matches_reference(init):
+    rows = np.frombuffer(payload(16 * 64), dtype=np.uint8).reshape(64, 16)
+    hashes = tv.crc16_ccitt_batch(rows, init)
+    assert hashes.dtype == np.uint16
+    assert hashes.tolist() == [crc16_reference(bytes(row), init) for row in rows]
+
+
+@pytest.mark.parametrize("impl", [tv.crc16_ccitt, tv.crc16_ccitt_slice4],
+                         ids=lambda f: f.__name__)
+def test_accepts_non_bytes(impl):
+    expected = crc16_reference(bytes(range(18)))
+    assert impl(bytearray(range(18))) == expected
+    assert impl(list(range(18))) == expected
+    assert impl(iter(range(18))) == expected
+
+
+@pytest.mark.parametrize("impl", [tv.crc16_ccitt, tv.crc16_ccitt_slice4, tv.crc16_ccitt_fast],
+                         ids=lambda f: f.__name__)
+def test_rejects_int(impl):
+    with pytest.raises(TypeError):
+        impl(5)
+
+
+@pytest.mark.parametrize("length", [4, 16, 64], ids=lambda n: f"len{n}")
+def test_patched_table_applies_after_cache_clear(length):
+    """Both the Python and Numba paths must read the live table"""
+    table = tv._CRC16_CCITT_TABLE
+    original = table.tolist()
+    data = payload(length)
+    try:
+        for i in range(256):
+            table[i] ^= 0x5A5A
+        tv.crc16_ccitt.cache_clear()
+        crc = 0xFFFF
+        for byte in data:
+            crc = ((crc << 8) ^ table[((crc >> 8) ^ byte) & 0xFF]) & 0xFFFF
+        assert tv.crc16_ccitt(data) == crc
+    finally:
+        table[:] = array.array('H', original)
+        tv.crc16_ccitt.cache_clear()
+    assert tv.crc16_ccitt(data) == crc16_reference(data)
+
+
+# Implementations that normalize input with bytes(), hashing the raw buffer
+BUFFER_IMPLS = [tv.crc16_ccitt, tv.crc16_ccitt_slice4, tv.crc16_ccitt_fast]
+
+
+@pytest.mark.parametrize("impl", BUFFER_IMPLS, ids=lambda f: f.__name__)
+def test_multibyte_item_buffers_hash_every_byte(impl):
+    words = array.array('H', range(16))
+    expected = crc16_reference(words.tobytes())
+    assert impl(memoryview(words)) == expected
+    assert impl(np.arange(16, dtype=np.uint16)) == expected
+
+
+def test_tile_vector_set_matches_checked_in_hashes():
+    vectors = tv.generate_tile_test_vector_set()
+    expected = (VECTOR_DIR / "expected_hashes.hex").read_text().split()
+    assert [f"{h:04X}" for h in vectors.hashes.tolist()] == expected
+    assert vectors.names == [name for name, _ in tv._TILES]
+
+
+def test_tile_vector_set_tile_indexes_like_a_list():
+    vectors = tv.generate_tile_test_vector_set()
+    tiles = [data for _, data in tv._TILES]
+    assert bytes(vectors.tile(0)) == tiles[0]
+    assert bytes(vectors.tile(-1)) == tiles[-1]
+    for i in (len(tiles), -len(tiles) - 1, 100):
+        with pytest.raises(IndexError):
+            vectors.tile(i)